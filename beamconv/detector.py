@@ -1,12 +1,274 @@
 import os
+import math
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 import numpy as np
 import healpy as hp
 from beamconv import tools
 
+@lru_cache(maxsize=2)
+def _gauss_blm_cached(fwhm, lmax):
+    '''
+    Generate the spin 0 and -2 blm arrays of a unit
+    amplitude Gaussian beam. Results of the last few calls are
+    cached so that beams with identical fwhm and lmax share the
+    arrays. The spin +2 array is zero and therefore not cached.
+
+    Arguments
+    ---------
+    fwhm : float
+        FWHM specifying Gaussian (arcmin)
+    lmax : int
+        Band-limit specifying array layout
+
+    Returns
+    -------
+    blm, blmm2 : tuple of array-like
+        Read-only blm arrays.
+    '''
+
+    blm, blmm2, _ = tools.gauss_copol_blm(fwhm, lmax)
+
+    blm.flags.writeable = False
+    blmm2.flags.writeable = False
+
+    return blm, blmm2
+
+@lru_cache(maxsize=128)
+def _alm_size(lmax, mmax=None):
+    '''Cached `healpy.Alm.getsize()`.'''
+    return hp.Alm.getsize(lmax, mmax=mmax)
+
+def _read_fits_blm(blm_file):
+    '''
+    Read blm array(s) from .fits file using a single file handle.
+
+    Arguments
+    ---------
+    blm_file : str
+        Path to .fits file in l**2+l+m+1 order (i.e. written by
+        healpy.write_alm). If file has three HDUs, they are assumed
+        to contain blm, blmm2 and blmp2.
+
+    Returns
+    -------
+    blm : array-like
+        Complex array of shape (1, size) or (3, size), expanded
+        to mmax = lmax.
+    mmax : int
+        mmax of blm in file.
+    '''
+
+    with hp.fitsfunc.pf.open(blm_file, memmap=True) as hdulist:
+
+        npol = 3 if len(hdulist) - 1 == 3 else 1
+
+        for pidx in range(npol):
+            data = hdulist[pidx+1].data
+            idx = data.field(0)
+            ell = np.floor(np.sqrt(idx - 1)).astype(int)
+            m = idx - ell ** 2 - ell - 1
+
+            if (m < 0).any():
+                raise ValueError("Negative m value encountered")
+
+            if pidx == 0:
+                lmax = ell.max()
+                mmax = m.max()
+                # For now, expand blm to full size. Only elements
+                # with m > mmax are not filled by file.
+                nfill = _alm_size(lmax, mmax=mmax)
+                blm = np.empty((npol, _alm_size(lmax)),
+                               dtype=np.complex128)
+
+            elif ell.max() != lmax or m.max() != mmax:
+                raise ValueError("mmax does not match between s=0,-2,2")
+
+            if idx.size == nfill:
+                blm[pidx,nfill:] = 0
+            else:
+                # Incomplete file, zero everything.
+                blm[pidx] = 0
+
+            i = hp.Alm.getidx(lmax, ell, m)
+            blm[pidx].real[i] = data.field(1)
+            blm[pidx].imag[i] = data.field(2)
+
+    return blm, int(mmax)
+
+# Weak references to blm arrays loaded from file, keyed on the arguments
+# of `_load_blm_cached()`. Arrays are shared between beams and freed once
+# no beam holds them anymore, unless still among the recently used ones.
+_blm_file_cache = {}
+# Strong references to the most recently used arrays, such that beams
+# that are loaded and deleted one after the other (as in the scan loop)
+# still share a single read of the file.
+_blm_file_recent = OrderedDict()
+_blm_file_recent_size = 2
+
+def _load_blm_cached(blm_file, fstat, cross_pol, deconv_q=False,
+                     normalize=False, c2_fwhm=None):
+    '''
+    Return blm arrays loaded from file, reusing the arrays of an
+    earlier call with identical arguments if those are still alive.
+    The arrays of the last few calls are kept alive by the cache.
+
+    Arguments
+    ---------
+    blm_file : str
+        Absolute path to .npy or .fits file
+    fstat : tuple
+        Modification time (ns) and size of file. Only used as part of
+        the cache key such that modified files are loaded again.
+    cross_pol : bool
+        Whether to use the cross-polar response if present in file.
+
+    Keyword arguments
+    -----------------
+    kwargs : {_load_blm_file_opts}
+
+    Returns
+    -------
+    blm, blmm2, blmp2 : tuple of array-like
+        Read-only blm arrays. May be memory-mapped.
+    mmax : int, None
+        mmax of blm in .fits file, None for .npy file.
+    '''
+
+    key = (blm_file, fstat, cross_pol, deconv_q, normalize, c2_fwhm)
+    try:
+        refs, mmax = _blm_file_cache[key]
+        blm = tuple(ref() for ref in refs)
+    except KeyError:
+        blm = (None,)
+
+    if any(b is None for b in blm):
+        blm, mmax = _load_blm_file(blm_file, cross_pol, deconv_q=deconv_q,
+                                   normalize=normalize, c2_fwhm=c2_fwhm)
+
+        # Drop entries of arrays that have been freed.
+        for dkey in [k for k, (refs, _) in _blm_file_cache.items()
+                     if any(ref() is None for ref in refs)]:
+            del _blm_file_cache[dkey]
+
+        _blm_file_cache[key] = (tuple(weakref.ref(b) for b in blm), mmax)
+
+    _blm_file_recent[key] = blm
+    _blm_file_recent.move_to_end(key)
+    if len(_blm_file_recent) > _blm_file_recent_size:
+        _blm_file_recent.popitem(last=False)
+
+    return blm, mmax
+
+def _load_blm_file(blm_file, cross_pol, deconv_q=False, normalize=False,
+                   c2_fwhm=None):
+    '''
+    Load blm array(s) from file and compute the spin 0, -2 and +2
+    blm arrays.
+
+    Arguments
+    ---------
+    blm_file : str
+        Absolute path to .npy or .fits file
+    cross_pol : bool
+        Whether to use the cross-polar response if present in file.
+
+    Keyword arguments
+    -----------------
+    deconv_q : bool
+        See `tools.scale_blm()` (default : False)
+    normalize : bool
+        See `tools.scale_blm()` (default : False)
+    c2_fwhm : float, None
+        See `tools.get_copol_blm()`. Ignored when the cross-polar
+        response is used. (default : None)
+
+    Returns
+    -------
+    blm, blmm2, blmp2 : tuple of array-like
+        Read-only blm arrays. May be memory-mapped.
+    mmax : int, None
+        mmax of blm in .fits file, None for .npy file.
+
+    Notes
+    -----
+    .npy files are memory-mapped, the arrays are only copied into
+    memory if `deconv_q` or `normalize` is set.
+    '''
+
+    mmax = None
+    ext = os.path.splitext(blm_file)[1]
+    if ext == '.fits':
+        blm, mmax = _read_fits_blm(blm_file)
+
+    else:
+        if ext == '.npy':
+            try:
+                blm = np.load(blm_file, mmap_mode='r', allow_pickle=False)
+            except ValueError as e:
+                raise ValueError("Failed to load {}, note that pickled "
+                                 "(object) blm arrays are not supported. "
+                                 "numpy error: {}".format(blm_file, e)) from e
+        else:
+            try:
+                blm = np.load(blm_file, mmap_mode='r', allow_pickle=False)
+            except (IOError, ValueError):
+                # Assume .fits file instead.
+                blm, mmax = _read_fits_blm(blm_file)
+
+        if mmax is None and (deconv_q or normalize):
+            # Memory-mapped array is read-only, scale a copy.
+            blm = np.array(blm)
+
+    # Rank 2 arrays are (3, ..) or (1, ..), only use rows as views.
+    if blm.ndim == 2 and blm.shape[0] == 3 and cross_pol:
+        # Assume co- and cross-polar beams are provided
+        # c2_fwhm has no meaning if cross-pol is known
+        # Scaled in place for (3, ..) array.
+        blm = tools.scale_blm(blm, deconv_q=deconv_q, normalize=normalize)
+        blm = blm[0], blm[1], blm[2]
+
+    else:
+        if blm.ndim == 2:
+            blm = blm[0]
+
+        # Assume co-polarized beam, create spin -2 and +2 components.
+        blm = tools.get_copol_blm(blm, c2_fwhm=c2_fwhm, deconv_q=deconv_q,
+                                  normalize=normalize)
+
+    for b in blm:
+        b.flags.writeable = False
+
+    return blm, mmax
+
 class Beam(object):
     '''
     A class representing detector and beam properties.
     '''
+
+    # Only attributes listed here can be set. Attributes set from
+    # outside the class, e.g. `q_off` (set by `ScanStrategy.scan()`)
+    # or keys passed to `Instrument.set_global_prop()`, have to be
+    # listed here as well.
+    __slots__ = ('az', 'el', '_polang', 'name', 'pol', 'btype', '_dead',
+                 'amplitude', 'po_file', 'eg_file', 'cross_pol', '_lmax',
+                 '_mmax', 'sensitive_freq', '_fwhm', 'deconv_q', 'normalize',
+                 '_polang_error', '_polang_truth', 'idx', 'symmetric',
+                 '_ghost', '_ghosts', '_ghost_count', '_ghost_idx', '_blm',
+                 'q_off')
+
+    # Order in which `create_ghost()` sets keyword arguments, matches
+    # `__init__()`.
+    _opts_order = ('az', 'el', 'polang', 'pol', 'btype', 'dead', 'amplitude',
+                   'po_file', 'eg_file', 'cross_pol', 'lmax', 'mmax',
+                   'sensitive_freq', 'fwhm', 'deconv_q', 'normalize',
+                   'polang_error', 'idx', 'symmetric')
+
+    # Attributes that are not copied by `_fast_copy()`.
+    _no_copy = ('_ghost', '_ghosts', '_ghost_count', '_ghost_idx', '_blm',
+                'q_off')
+
     def __init__(self, az=0., el=0., polang=0., name=None,
                  pol='A', btype='Gaussian', fwhm=None, lmax=700, mmax=None, sensitive_freq = np.array([1.5e9]),
                  dead=False, ghost=False, amplitude=1., po_file=None,
@@ -82,7 +344,7 @@ class Beam(object):
 
         self.az = az
         self.el = el
-        self.polang = polang
+        self._polang = polang
         self.name = name
         self.pol = pol
         self.btype = btype
@@ -97,60 +359,124 @@ class Beam(object):
         self.fwhm = fwhm
         self.deconv_q = deconv_q
         self.normalize = normalize
-        self.polang_error = polang_error
-        self._idx = idx
+        self._polang_error = polang_error
+        self._polang_truth = polang + polang_error
+        self.idx = idx
         self.symmetric = symmetric
 
-        self.__ghost = ghost
+        self._ghost = ghost
         # Ghosts are not allowed to have ghosts
         if not self.ghost:
-            self.__ghosts = []
+            self._ghosts = []
             self.ghost_count = 0
 
-    @property
-    def idx(self):
-        return self._idx
+        # blm are created or loaded when first accessed.
+        self._blm = None
+
+    @classmethod
+    def _fast_copy(cls, parent, name=None):
+        '''
+        Create a ghost by copying the attributes of an already
+        initialized Beam object without calling `__init__()` and
+        the setters again. blm, ghost attributes and q_off are not
+        copied.
+
+        Arguments
+        ---------
+        parent : Beam object
+
+        Keyword arguments
+        -----------------
+        name : str, None
+            Name of the copy (default : None)
+
+        Returns
+        -------
+        new : Beam object
+        '''
+
+        new = object.__new__(cls)
+        for attr in cls.__slots__:
+            if attr in cls._no_copy:
+                continue
+            try:
+                setattr(new, attr, getattr(parent, attr))
+            except AttributeError:
+                # Attribute not set on parent.
+                pass
+
+        # Do not share the (mutable) array with the parent.
+        if parent.sensitive_freq is not None:
+            new.sensitive_freq = np.array(parent.sensitive_freq)
+
+        new.name = name
+        new._ghost = True
+        new._blm = None
+
+        return new
+
+    def __getstate__(self):
+        '''
+        Return the attributes that are set, such that Beam objects
+        can be pickled with any protocol despite `__slots__`.
+        '''
+
+        state = {}
+        for attr in self.__slots__:
+            try:
+                state[attr] = getattr(self, attr)
+            except AttributeError:
+                # Attribute not set.
+                pass
+
+        return state
+
+    def __setstate__(self, state):
+        '''Restore attributes returned by `__getstate__()`.'''
+
+        for attr, val in state.items():
+            setattr(self, attr, val)
 
     @property
     def ghost(self):
-        return self.__ghost
+        return self._ghost
 
     @property
     def ghosts(self):
         '''Return list of ghost beams.'''
-        return self.__ghosts
+        return self._ghosts
 
     @property
     def ghost_count(self):
-        return self.__ghost_count
+        return self._ghost_count
 
     @ghost_count.setter
     def ghost_count(self, count):
         if not self.ghost:
-            self.__ghost_count = count
+            self._ghost_count = count
         else:
             raise ValueError("ghost cannot have ghost_count")
 
     @property
     def ghost_idx(self):
         '''If two ghosts share ghost_idx, they share blm.'''
-        return self.__ghost_idx
+        return self._ghost_idx
 
     @ghost_idx.setter
     def ghost_idx(self, val):
         if self.ghost:
-            self.__ghost_idx = val
+            self._ghost_idx = val
         else:
             raise ValueError("main beam cannot have ghost_idx")
 
     @property
     def dead(self):
-        return self.__dead
+        return self._dead
 
     @dead.setter
     def dead(self, val):
         '''Make sure ghosts are also declared dead when main beam is.'''
-        self.__dead = val
+        self._dead = val
         try:
             for ghost in self.ghosts:
                 ghost.dead = val
@@ -160,20 +486,20 @@ class Beam(object):
 
     @property
     def lmax(self):
-        return self.__lmax
+        return self._lmax
 
     @lmax.setter
     def lmax(self, val):
         '''Make sure lmax is >= 0 and defaults to something sensible'''
         if val is None and self.fwhm is not None:
             # Going up to 1.4 naive Nyquist frequency set by beam scale
-            self.__lmax = int(2 * np.pi / np.radians(self.fwhm/60.) * 1.4)
+            self._lmax = int(2 * math.pi / math.radians(self.fwhm/60.) * 1.4)
         else:
-            self.__lmax = max(val, 0)
+            self._lmax = max(val, 0)
 
     @property
     def fwhm(self):
-        return self.__fwhm
+        return self._fwhm
 
     @fwhm.setter
     def fwhm(self, val):
@@ -183,20 +509,24 @@ class Beam(object):
         fwhm is None.
         '''
         if val is None and self.lmax:
-            val = (1.4 * 2. * np.pi) / float(self.lmax)
-            self.__fwhm = np.degrees(val) * 60
+            val = (1.4 * 2. * math.pi) / float(self.lmax)
+            self._fwhm = math.degrees(val) * 60
         else:
-            self.__fwhm = np.abs(val)
+            self._fwhm = abs(float(val))
 
     @property
     def mmax(self):
-        return self.__mmax
+        return self._mmax
 
     @mmax.setter
     def mmax(self, mmax):
         '''Set mmax to lmax if not set.'''
-        self.__mmax = min(i for i in [mmax, self.lmax] \
-                              if i is not None)
+        if mmax is None:
+            self._mmax = self.lmax
+        elif self.lmax is None:
+            self._mmax = mmax
+        else:
+            self._mmax = min(mmax, self.lmax)
 
     @property
     def blm(self):
@@ -210,50 +540,84 @@ class Beam(object):
         btype is changes, blm will not be updated,
         first delete blm attribute in that case.
         '''
-        try:
-            return self.__blm
-        except AttributeError:
+        blm = self._blm
+        if blm is not None:
+            return blm
 
-            if self.btype == 'Gaussian':
-                self.gen_gaussian_blm()
-                return self.__blm
+        if self.btype == 'Gaussian':
+            self.gen_gaussian_blm()
+            return self._blm
 
-            else:
-                # NOTE, if blm's are direct map2alm resuls, use deconv_q.
+        else:
+            # NOTE, if blm's are direct map2alm resuls, use deconv_q.
 
-                if self.btype == 'PO':
-                    self.load_blm(self.po_file, deconv_q=self.deconv_q,
-                                  normalize=self.normalize)
-                    return self.__blm
+            if self.btype == 'PO':
+                self.load_blm(self.po_file, deconv_q=self.deconv_q,
+                              normalize=self.normalize)
+                return self._blm
 
-                elif self.btype == 'EG':
-                    self.load_blm(self.eg_file, deconv_q=self.deconv_q,
-                                  normalize=self.normalize)
-                    return self.__blm
+            elif self.btype == 'EG':
+                self.load_blm(self.eg_file, deconv_q=self.deconv_q,
+                              normalize=self.normalize)
+                return self._blm
 
-                else:
-                    raise ValueError("btype = {} not recognized".format(self.btype))
+            else:
+                raise ValueError("btype = {} not recognized".format(self.btype))
 
     @blm.setter
     def blm(self, val):
-        self.__blm = val
+        self._blm = val
 
     @blm.deleter
     def blm(self):
-        del self.__blm
+        self._blm = None
+
+    @property
+    def polang(self):
+        return self._polang
+
+    @polang.setter
+    def polang(self, val):
+        '''Also update cached `polang_truth`.'''
+        self._polang = val
+        self._polang_truth = val + self._polang_error
+
+    @property
+    def polang_error(self):
+        return self._polang_error
+
+    @polang_error.setter
+    def polang_error(self, val):
+        '''Also update cached `polang_truth`.'''
+        self._polang_error = val
+        self._polang_truth = self._polang + val
 
     @property
     def polang_truth(self):
-        return self.polang + self.polang_error
+        '''Polarization angle used for scanning: polang + polang_error.'''
+        return self._polang_truth
 
     def __str__(self):
 
-        return "name    : {} \nbtype   : {} \nalive   : {} \nFWHM"\
-            "    : {} arcmin \naz      : {} deg \nel      : {} deg "\
-            "\npolang  : {} deg\npo_file : {} \n".\
-            format(self.name, self.btype,
-                str(not self.dead), self.fwhm, self.az, self.el,
-                self.polang_truth, self.po_file)
+        return (f"name    : {self.name} \n"
+                f"btype   : {self.btype} \n"
+                f"alive   : {not self.dead} \n"
+                f"FWHM    : {self.fwhm} arcmin \n"
+                f"az      : {self.az} deg \n"
+                f"el      : {self.el} deg \n"
+                f"polang  : {self.polang_truth} deg\n"
+                f"po_file : {self.po_file} \n")
+
+    @classmethod
+    def clear_gauss_cache(cls):
+        '''Empty the cache of Gaussian blm arrays shared between beams.'''
+        _gauss_blm_cached.cache_clear()
+
+    @classmethod
+    def clear_file_cache(cls):
+        '''Empty the cache of blm arrays loaded from file.'''
+        _blm_file_cache.clear()
+        _blm_file_recent.clear()
 
     def gen_gaussian_blm(self):
         '''
@@ -265,15 +629,19 @@ class Beam(object):
         Harmonic coefficients are multiplied by factor
         sqrt(4 pi / (2 ell + 1)) and scaled by
         `amplitude` attribute (see `Beam.__init__()`).
+
+        Unscaled spin 0 and -2 arrays are cached and shared between
+        beams with identical fwhm and lmax, so they are read-only.
         '''
 
-        blm = tools.gauss_blm(self.fwhm, self.lmax, pol=False)
+        blm, blmm2 = _gauss_blm_cached(round(float(self.fwhm), 10),
+                                       int(self.lmax))
         if self.amplitude != 1:
-            blm *= self.amplitude
-        blm = tools.get_copol_blm(blm, c2_fwhm=self.fwhm)
+            blm = blm * self.amplitude
+            blmm2 = blmm2 * self.amplitude
 
         self.btype = 'Gaussian'
-        self.blm = blm
+        self.blm = blm, blmm2, np.zeros_like(blm)
 
     def load_blm(self, filename, **kwargs):
         '''
@@ -294,93 +662,47 @@ class Beam(object):
         Notes
         -----
         Loaded blm are automatically scaled by given the `amplitude`
-        attribute.
+        attribute. Unscaled arrays are shared between beams that
+        load the same (unmodified) file, so they are read-only.
+        Arrays are freed once no beam holds them and they are not
+        among the last two loaded, see `Beam.clear_file_cache()`.
 
         blm file can be rank 1 or 2. If rank is 1: array is blm and
         blmm2 and blmp2 are created assuming only the co-polar response
         If rank is 2, shape has to be (3,), with blm, blmm2 and blmp2
 
         .npy files are assumed to be healpy alm arrays written using
-        `numpy.save`. .fits files are assumed in l**2+l+m+1 order (i.e.
+        `numpy.save` (no pickled object arrays) and are memory-mapped.
+        Do not overwrite beam files while beams hold their blm:
+        accessing the mapped arrays of a truncated or rewritten file
+        may crash the process (SIGBUS).
+        .fits files are assumed in l**2+l+m+1 order (i.e.
         written by healpy.write_alm. mmax may be smaller than lmax.
         '''
 
         pname, ext = os.path.splitext(filename)
-        try:
-            if not ext:
-                # Assume .npy extension
+        if not ext:
+            # Assume .npy extension, else .fits file.
+            if os.path.isfile(pname + '.npy'):
                 ext = '.npy'
-            blm = np.load(os.path.join(pname+ext), allow_pickle=True)
-
-        except IOError:
-            if not ext:
-                # Assume .fits file instead
-                ext = '.fits'
-            blm_file = os.path.join(pname+ext)
-
-            hdulist = hp.fitsfunc.pf.open(blm_file)
-            npol = len(hdulist)-1
-            hdulist.close()
-
-            blm_read, mmax = hp.read_alm(blm_file, hdu=1, return_mmax=True)
-
-            # For now, expand blm to full size.
-            lmax = hp.Alm.getlmax(blm_read.size, mmax=mmax)
-            blm = np.zeros(hp.Alm.getsize(lmax), dtype=np.complex128)
-            blm[:blm_read.size] = blm_read
-
-            if npol == 3:
-                blmm2_read, mmaxm2 = hp.read_alm(blm_file, hdu=2, return_mmax=True)
-                blmp2_read, mmaxp2 = hp.read_alm(blm_file, hdu=3, return_mmax=True)
-
-                if not mmax == mmaxm2 == mmaxp2:
-                    raise ValueError("mmax does not match between s=0,-2,2")
-
-                # Expand.
-                blmm2 = np.zeros_like(blm)
-                blmp2 = np.zeros_like(blm)
-
-                blmm2[:blmm2_read.size] = blmm2_read
-                blmp2[:blmp2_read.size] = blmp2_read
-
-                blm = (blm, blmm2, blmp2)
-
-            # Update mmax if needed.
-            if mmax is None:
-                self.mmax = mmax
             else:
-                if mmax < self.mmax:
-                    self.mmax = mmax
-
-        # If tuple turn to (3, ) or (1, ..) array.
-        blm = np.atleast_2d(blm)
-
-        if blm.shape[0] == 3 and self.cross_pol:
-            cross_pol = True
-        else:
-            cross_pol = False
-            blm = blm[0]
-
-        if cross_pol:
-            # Assume co- and cross-polar beams are provided
-            # c2_fwhm has no meaning if cross-pol is known
-            kwargs.pop('c2_fwhm', None)
-            blm = tools.scale_blm(blm, **kwargs)
+                ext = '.fits'
+        blm_file = os.path.abspath(pname + ext)
 
-            if self.amplitude != 1:
-                # Scale beam if needed
-                blm *= self.amplitude
+        fstat = os.stat(blm_file)
+        blm, mmax = _load_blm_cached(blm_file,
+                                     (fstat.st_mtime_ns, fstat.st_size),
+                                     self.cross_pol, **kwargs)
 
-            self.blm = blm[0], blm[1], blm[2]
+        # Update mmax if needed.
+        if mmax is not None and mmax < self.mmax:
+            self.mmax = mmax
 
-        else:
-            # Assume co-polarized beam
-            if self.amplitude != 1:
-                # scale beam if needed
-                blm *= self.amplitude
+        if self.amplitude != 1:
+            # Scale beam if needed, cached arrays are left untouched.
+            blm = tuple(np.multiply(b, self.amplitude) for b in blm)
 
-            # Create spin \pm 2 components
-            self.blm = tools.get_copol_blm(blm, **kwargs)
+        self.blm = blm
 
     def create_ghost(self, tag='ghost', **kwargs):
         '''
@@ -417,30 +739,24 @@ class Beam(object):
         else:
             name = parent_name
 
-        # mostly default to parent kwargs
-        ghost_opts = dict(az=self.az,
-                          el=self.el,
-                          polang=self.polang,
-                          name=name,
-                          pol=self.pol,
-                          btype=self.btype,
-                          fwhm=self.fwhm,
-                          dead=self.dead,
-                          lmax=self.lmax,
-                          mmax=self.mmax,
-                          amplitude=self.amplitude,
-                          po_file=self.po_file,
-                          eg_file=self.eg_file,
-                          cross_pol=self.cross_pol,
-                          deconv_q=self.deconv_q,
-                          normalize=self.normalize,
-                          polang_error=self.polang_error)
+        kwargs.pop('ghost', None)
+        for key in kwargs:
+            if key not in self._opts_order:
+                raise TypeError("create_ghost() got an unexpected keyword "
+                                "argument '{}'".format(key))
+
+        # mostly default to parent attributes, idx is not shared.
+        ghost = type(self)._fast_copy(self, name=name)
+        ghost.idx = None
 
         # Note, amplitude is applied after normalization
-        # update options with specified kwargs
-        ghost_opts.update(kwargs)
-        ghost_opts.update(dict(ghost=True))
-        ghost = Beam(**ghost_opts)
+        # update attributes with specified kwargs
+        for key in self._opts_order:
+            if key in kwargs:
+                setattr(ghost, key, kwargs[key])
+            elif key == 'mmax' and 'lmax' in kwargs:
+                # Make sure mmax <= new lmax.
+                ghost.mmax = ghost.mmax
 
         # set ghost_idx
         ghost.ghost_idx = self.ghost_count
@@ -483,18 +799,11 @@ class Beam(object):
             (default : True)
         '''
 
-        try:
-            del(self.blm)
-        except AttributeError:
-            # no blm attribute to begin with
-            pass
+        del(self.blm)
 
-        if any(self.ghosts) and del_ghosts_blm:
+        if self.ghosts and del_ghosts_blm:
             for ghost in self.ghosts:
-                try:
-                    del(ghost.blm)
-                except AttributeError:
-                    pass
+                del(ghost.blm)
 
     def get_offsets(self):
         '''
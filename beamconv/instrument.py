@@ -377,20 +377,20 @@ class Instrument(MPIBase):
         if isseq is False:
             beams2add = [[beams, None]]
             ndet2add += 1
-            beams._idx = idx
+            beams.idx = idx
 
         if isseq:
             beams2add = []
             for pair in beams:
                 if isnestseq is False:
-                    pair._idx = idx
+                    pair.idx = idx
                     pair = [pair, None]
                     ndet2add += 1
                     idx += 1
                 else:
                     ndet2add += 2
-                    pair[0]._idx = idx
-                    pair[1]._idx = idx + 1
+                    pair[0].idx = idx
+                    pair[1].idx = idx + 1
                     idx += 2
 
                 beams2add.append(pair)
@@ -998,7 +998,8 @@ class Instrument(MPIBase):
         Arguments
         ---------
         prop : dict
-            Dict with attribute(s) and values for beams
+            Dict with attribute(s) and values for beams. Attributes
+            have to be existing `Beam` attributes (see `Beam.__slots__`).
 
         Keyword arguments
         -----------------
@@ -1053,7 +1054,8 @@ class Instrument(MPIBase):
         Arguments
         ---------
         prop : dict
-            Dict with attribute(s) and values for beams
+            Dict with attribute(s) and values for beams. Attributes
+            have to be existing `Beam` attributes (see `Beam.__slots__`).
 
         Keyword arguments
         -----------------
@@ -1100,7 +1102,8 @@ class Instrument(MPIBase):
         Arguments
         ---------
         prop : dict
-            Dict with attribute and value for beams
+            Dict with attribute and value for beams. Attribute
+            has to be an existing `Beam` attribute (see `Beam.__slots__`).
 
         Keyword arguments
         -----------------
@@ -110,6 +110,40 @@ def gauss_blm(fwhm, lmax, pol=False):
     else:
         return blm
 
+def gauss_copol_blm(fwhm, lmax):
+    '''
+    Generate the spin 0, -2 and +2 blm arrays of an
+    azimuthally-symmetric, purely co-polarized Gaussian beam
+    normalized at (ell,m) = (0,0).
+
+    Arguments
+    ---------
+    fwhm : int
+        FWHM specifying Gaussian (arcmin)
+    lmax : int
+        Band-limit specifying array layout
+
+    Returns
+    -------
+    blm, blmm2, blmp2 : tuple of array-like
+        Identical to `get_copol_blm(gauss_blm(fwhm, lmax), c2_fwhm=fwhm)`.
+
+    Notes
+    -----
+    For a Gaussian beam the spin -2 part is nonzero only in the
+    m=2 slice and the spin +2 part vanishes, so the loop over m
+    in `unpol2pol()` is skipped.
+    '''
+
+    blm, blmm2 = gauss_blm(fwhm, lmax, pol=True)
+    blmp2 = np.zeros_like(blm)
+
+    if fwhm:
+        s2fwhm = 2 * np.sqrt(2 * np.log(2))
+        blmm2 *= np.exp(2 * (np.radians(fwhm / 60.) / s2fwhm)**2)
+
+    return blm, blmm2, blmp2
+
 def scale_blm(blm, normalize=False, deconv_q=False):
     '''
     Scale or normalize blm(s)
@@ -142,11 +176,15 @@ def scale_blm(blm, normalize=False, deconv_q=False):
     ell = np.arange(lmax+1)
 
     if deconv_q:
-        qell = 2 * np.sqrt(np.pi / (2. * ell + 1))
-        for i in range(blm.shape[0]):
-            hp.almxfl(blm[i], qell, inplace=True)
+        fl = 2 * np.sqrt(np.pi / (2. * ell + 1))
+    else:
+        fl = np.ones(lmax+1)
     if normalize:
-        blm /= blm[0,0]
+        # Fold normalization into fl, so blm are scaled in one pass.
+        fl = fl / (blm[0,0] * fl[0])
+
+    for i in range(blm.shape[0]):
+        hp.almxfl(blm[i], fl, inplace=True)
 
     if blm.shape[0] == 1:
         return blm[0]
@@ -162,6 +200,8 @@ def unpol2pol(blm):
     ---------
     blm : array-like
         Spin-0 harmonic coefficients of real field in HEALPix format.
+        May have leading dimensions, e.g. (nbeams, size) for a stack
+        of beams, which are all transformed at once.
 
     Returns
     -------
@@ -175,12 +215,11 @@ def unpol2pol(blm):
     constant on \Delta ell = 5 for ell < ~20.
     '''
 
-    lmax = hp.Alm.getlmax(blm.size)
-    lm = hp.Alm.getlm(lmax)
+    lmax = hp.Alm.getlmax(blm.shape[-1])
     getidx = hp.Alm.getidx
 
-    blmm2 = np.zeros(blm.size, dtype=np.complex128)
-    blmp2 = np.zeros(blm.size, dtype=np.complex128)
+    blmm2 = np.zeros(blm.shape, dtype=np.complex128)
+    blmp2 = np.zeros(blm.shape, dtype=np.complex128)
 
     for m in range(lmax+1): # loop over spin -2 m's
         start = getidx(lmax, m, m)
@@ -193,21 +232,21 @@ def unpol2pol(blm):
             assert end == hp.Alm.getsize(lmax)
         if m == 0:
             # +2 here because spin-2, so we can't have nonzero ell=1 bins
-            blmm2[start+2:end] = np.conj(blm[2*lmax+1:3*lmax])
+            blmm2[...,start+2:end] = np.conj(blm[...,2*lmax+1:3*lmax])
 
-            blmp2[start+2:end] = blm[2*lmax+1:3*lmax]
+            blmp2[...,start+2:end] = blm[...,2*lmax+1:3*lmax]
 
         elif m == 1:
             # +1 here because spin-2, so we can't have nonzero ell=1 bins
-            blmm2[start+1:end] = -np.conj(blm[start+1:end])
+            blmm2[...,start+1:end] = -np.conj(blm[...,start+1:end])
 
-            blmp2[start+2:end] = blm[3*lmax:4*lmax-2]
+            blmp2[...,start+2:end] = blm[...,3*lmax:4*lmax-2]
 
         else:
             start_0 = getidx(lmax, m-2, m-2) # Spin-0 start and end
             end_0 = getidx(lmax, m-1, m-1)
 
-            blmm2[start:end] = blm[start_0+2:end_0]
+            blmm2[...,start:end] = blm[...,start_0+2:end_0]
 
             start_p0 = getidx(lmax, m+2, m+2)
             if m + 2 > lmax:
@@ -215,7 +254,7 @@ def unpol2pol(blm):
                 continue
             end_p0 = getidx(lmax, m+3, m+3)
 
-            blmp2[start+2:end] = blm[start_p0:end_p0]
+            blmp2[...,start+2:end] = blm[...,start_p0:end_p0]
 
     return blmm2, blmp2
 
@@ -4,6 +4,8 @@ import healpy as hp
 from beamconv import Beam
 import os
 import pickle
+import weakref
+import gc
 
 opj = os.path.join
 test_data_dir = os.path.abspath(opj(os.path.dirname(__file__),
@@ -187,6 +189,23 @@ class TestTools(unittest.TestCase):
         np.testing.assert_array_almost_equal(blm_expd,
                                              beam.blm[2])
 
+    def test_load_blm_normalize(self):
+        '''
+        Test whether the amplitude is applied after normalization
+        for both rank 1 and rank 2 blm files.
+        '''
+
+        beam_opts = self.beam_opts.copy()
+        beam_opts['normalize'] = True
+
+        beam = Beam(**beam_opts)
+        self.assertAlmostEqual(beam.blm[0][0], beam.amplitude)
+
+        beam_opts['po_file'] = self.blm_cross_name
+        beam_opts['cross_pol'] = True
+        beam2 = Beam(**beam_opts)
+        self.assertAlmostEqual(beam2.blm[0][0], beam2.amplitude)
+
     def test_polang_error(self):
         '''
         Test wheter polang_truth = polang + polang_error
@@ -214,6 +233,183 @@ class TestTools(unittest.TestCase):
         self.assertEqual(beam.polang_truth,
                          beam.polang + beam.polang_error)
 
+    def test_gen_gaussian_blm_cache(self):
+        '''
+        Test whether Gaussian beams with identical fwhm and lmax
+        share their (read-only) blm arrays.
+        '''
+
+        Beam.clear_gauss_cache()
+        beam = Beam(fwhm=30., lmax=100)
+        beam2 = Beam(fwhm=30., lmax=100)
+
+        for i in range(2):
+            self.assertIs(beam.blm[i], beam2.blm[i])
+            self.assertFalse(beam.blm[i].flags.writeable)
+
+        # Spin +2 array is zero and not shared.
+        self.assertIsNot(beam.blm[2], beam2.blm[2])
+        self.assertFalse(np.any(beam.blm[2]))
+
+        # Scaled beam should not touch shared arrays.
+        beam3 = Beam(fwhm=30., lmax=100, amplitude=2.)
+        for i in range(3):
+            np.testing.assert_array_almost_equal(beam3.blm[i],
+                                                 2 * beam.blm[i])
+
+        Beam.clear_gauss_cache()
+        beam4 = Beam(fwhm=30., lmax=100)
+        self.assertIsNot(beam.blm[0], beam4.blm[0])
+        np.testing.assert_array_almost_equal(beam.blm[0], beam4.blm[0])
+
+    def test_load_blm_cache(self):
+        '''
+        Test whether beams loading the same file share their
+        (read-only) blm arrays.
+        '''
+
+        Beam.clear_file_cache()
+        beam_opts = self.beam_opts.copy()
+        beam_opts['amplitude'] = 1.
+        beam = Beam(**beam_opts)
+        beam2 = Beam(**beam_opts)
+
+        for i in range(3):
+            self.assertIs(beam.blm[i], beam2.blm[i])
+            self.assertFalse(beam.blm[i].flags.writeable)
+
+        # Scaled beam should not touch shared arrays.
+        beam3 = Beam(**self.beam_opts)
+        for i in range(3):
+            np.testing.assert_array_almost_equal(
+                beam3.blm[i], beam3.amplitude * beam.blm[i])
+
+    def test_load_blm_pickled(self):
+        '''
+        Test whether loading a pickled .npy file raises a ValueError
+        instead of falling back to the .fits reader.
+        '''
+
+        blm_name = opj(test_data_dir, 'blm_test_pickled.npy')
+        np.save(blm_name, np.asarray([self.blm, None], dtype=object))
+
+        beam_opts = self.beam_opts.copy()
+        beam_opts['po_file'] = blm_name
+        beam = Beam(**beam_opts)
+        try:
+            self.assertRaisesRegex(ValueError, 'pickled',
+                                   getattr, beam, 'blm')
+        finally:
+            os.remove(blm_name)
+
+    def test_load_blm_cache_delete(self):
+        '''
+        Test whether deleting blm and clearing the cache releases
+        the loaded arrays.
+        '''
+
+        Beam.clear_file_cache()
+        beam_opts = self.beam_opts.copy()
+        beam_opts['amplitude'] = 1.
+        beam_opts['deconv_q'] = True
+        beam = Beam(**beam_opts)
+        beam2 = Beam(**beam_opts)
+
+        refs = [weakref.ref(b) for b in beam.blm]
+        self.assertIs(beam2.blm[0], refs[0]())
+
+        # Still held by second beam.
+        beam.delete_blm()
+        gc.collect()
+        self.assertTrue(all(ref() is not None for ref in refs))
+
+        # Still held by the cache of recently used arrays.
+        beam2.delete_blm()
+        gc.collect()
+        self.assertTrue(all(ref() is not None for ref in refs))
+
+        Beam.clear_file_cache()
+        gc.collect()
+        self.assertTrue(all(ref() is None for ref in refs))
+
+        # Reloaded if needed.
+        self.assertAlmostEqual(beam.blm[0][0], 2 * np.sqrt(np.pi))
+
+    def test_load_blm_cache_reuse(self):
+        '''
+        Test whether a beam that loads the file of an already deleted
+        beam reuses the arrays, like in the scan loop.
+        '''
+
+        Beam.clear_file_cache()
+        beam_opts = self.beam_opts.copy()
+        beam_opts['amplitude'] = 1.
+        beam = Beam(**beam_opts)
+        beam2 = Beam(**beam_opts)
+
+        ref = weakref.ref(beam.blm[0])
+        beam.delete_blm()
+        gc.collect()
+
+        self.assertIs(beam2.blm[0], ref())
+
+    def test_create_ghost(self):
+        '''
+        Test whether ghosts copy parent attributes and apply
+        specified kwargs.
+        '''
+
+        beam = Beam(name='det', idx=3, lmax=100, mmax=50,
+                    **self.beam_opts)
+        beam.create_ghost(amplitude=0.1, lmax=40, polang_error=2.)
+        beam.create_ghost(tag='g2')
+
+        ghost, ghost2 = beam.ghosts
+        self.assertEqual(ghost.name, 'det_ghost')
+        self.assertEqual(ghost2.name, 'det_g2')
+        self.assertTrue(ghost.ghost)
+        self.assertEqual((ghost.ghost_idx, ghost2.ghost_idx), (0, 1))
+        self.assertEqual(beam.ghost_count, 2)
+        self.assertIsNone(ghost.idx)
+
+        # Copied from parent.
+        self.assertEqual(ghost.az, beam.az)
+        self.assertEqual(ghost.po_file, beam.po_file)
+        self.assertEqual(ghost2.amplitude, beam.amplitude)
+        self.assertEqual(ghost2.mmax, 50)
+        np.testing.assert_array_equal(ghost.sensitive_freq,
+                                      beam.sensitive_freq)
+        self.assertIsNot(ghost.sensitive_freq, beam.sensitive_freq)
+
+        # Specified kwargs.
+        self.assertEqual(ghost.amplitude, 0.1)
+        self.assertEqual(ghost.lmax, 40)
+        self.assertEqual(ghost.mmax, 40)
+        self.assertEqual(ghost.polang_truth, beam.polang + 2.)
+
+        # Dead parent means dead ghosts.
+        beam.dead = True
+        self.assertTrue(ghost.dead)
+
+        self.assertRaises(TypeError, beam.create_ghost, foo=1)
+        self.assertRaises(RuntimeError, ghost.create_ghost)
+
+    def test_pickle(self):
+        '''
+        Test whether Beam objects can be pickled with all protocols.
+        '''
+
+        beam = Beam(name='det', fwhm=30., lmax=20, polang_error=1.)
+        beam.create_ghost()
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            beam2 = pickle.loads(pickle.dumps(beam, protocol=protocol))
+
+            self.assertEqual(beam2.name, 'det')
+            self.assertEqual(beam2.polang_truth, beam.polang_truth)
+            self.assertEqual(beam2.ghosts[0].name, 'det_ghost')
+            np.testing.assert_array_almost_equal(beam2.blm[0], beam.blm[0])
+
 if __name__ == '__main__':
     unittest.main()
 
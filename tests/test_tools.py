@@ -96,6 +96,38 @@ class TestTools(unittest.TestCase):
         np.testing.assert_array_almost_equal(blmm2_expd, blmm2)
         np.testing.assert_array_almost_equal(blmp2_expd, blmp2)
 
+    def test_unpol2pol_stack(self):
+        '''
+        Test if a stack of blm arrays is transformed row by row.
+        '''
+
+        np.random.seed(10)
+        lmax = 6
+        size = hp.Alm.getsize(lmax)
+        blm_stack = np.random.randn(4, size) + 1j * np.random.randn(4, size)
+
+        blmm2, blmp2 = tools.unpol2pol(blm_stack)
+        self.assertEqual(blmm2.shape, blm_stack.shape)
+
+        for bidx in range(blm_stack.shape[0]):
+            blmm2_expd, blmp2_expd = tools.unpol2pol(blm_stack[bidx])
+            np.testing.assert_array_almost_equal(blmm2_expd, blmm2[bidx])
+            np.testing.assert_array_almost_equal(blmp2_expd, blmp2[bidx])
+
+    def test_gauss_copol_blm(self):
+        '''
+        Test if Gaussian copolarized beam matches the general
+        unpolarized to copolarized conversion.
+        '''
+
+        for fwhm, lmax in [(30., 100), (60., 3), (0., 10)]:
+            blm_gauss = tools.gauss_copol_blm(fwhm, lmax)
+            blm_expd = tools.get_copol_blm(tools.gauss_blm(fwhm, lmax),
+                                           c2_fwhm=fwhm)
+            for i in range(3):
+                np.testing.assert_array_almost_equal(blm_expd[i],
+                                                     blm_gauss[i])
+
     def test_sawtooth_wave(self):
 
         az_truth = np.array([0, 2, 4, 6, 8, 10, 0, 2, 4, 6, 8, 10],